@@ -6,11 +6,223 @@ directly in MkDocs pages without requiring pre-generation.
 """
 
 import os
+import re
+import ast
+import py_compile
 import yaml
+import importlib.util
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from importlib.metadata import version, PackageNotFoundError
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Parsed standard names and derived groupings, keyed by project directory.
+# Entries are reset in define_env so each build (including rebuilds under
+# `mkdocs serve`) parses the YAML tree exactly once.
+_CACHE = {}
+
+# Directories never descended into when looking for standard name files
+DEFAULT_SKIP_DIRS = frozenset(
+    {
+        "__pycache__",
+        "node_modules",
+        ".git",
+        ".venv",
+        "site",
+        ".mypy_cache",
+        ".pytest_cache",
+    }
+)
+
+# Patterns used by _fix_markdown_formatting, compiled once per process
+_MATH_PRE = re.compile(r"\n\s*\$\$")
+_MATH_POST = re.compile(r"\$\$\s*\n")
+
+# Generated module holding the pre-parsed standard names, relative to the
+# project directory. Importing it reuses the marshalled bytecode in
+# __pycache__, so a fresh cache skips YAML parsing altogether. It lives
+# outside the watched standard_names/ tree so refreshing it never triggers
+# another rebuild under `mkdocs serve`.
+CACHE_PATH = Path(".cache") / "standard_names.py"
+
+
+def _iter_yaml(path):
+    """Yield paths of YAML files below path, skipping hidden and build entries"""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name in DEFAULT_SKIP_DIRS or entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_yaml(entry.path)
+            elif entry.name.endswith((".yml", ".yaml")):
+                yield entry.path
+
+
+def _parse_one(path, prefix_len):
+    """Parse a single standard name file, returning None if it is unusable"""
+    try:
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_Loader)
+
+        if data and isinstance(data, dict):
+            # Add metadata, using plain string ops rather than Path objects
+            data["_file_path"] = path[prefix_len:]
+            data["_category"] = os.path.basename(os.path.dirname(path))
+            return data
+    except Exception as e:
+        print(f"Error loading {path}: {e}")
+
+    return None
+
+
+def collect_standard_names(project_root):
+    """Parse every standard name file below project_root/standard_names"""
+    root_str = str(Path(project_root))
+    standard_names_dir = os.path.join(root_str, "standard_names")
+
+    # Only look in the standard_names directory
+    if not os.path.isdir(standard_names_dir):
+        return []
+
+    # Walked paths all start with root_str and a separator, so slicing that
+    # prefix off gives the path relative to the project directory
+    paths = list(_iter_yaml(standard_names_dir))
+    prefix_len = len(root_str) + len(os.sep)
+
+    # Overlap file reads with parsing across many small files
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(partial(_parse_one, prefix_len=prefix_len), paths)
+        standard_names = [data for data in results if data is not None]
+
+    # Sort once here (and so in the cache) so every grouping is in name order
+    standard_names.sort(key=lambda x: x.get("name", ""))
+    return standard_names
+
+
+def _newest_mtime(path):
+    """Return the newest mtime of path and any YAML files or folders below it"""
+    newest = os.stat(path).st_mtime
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name in DEFAULT_SKIP_DIRS or entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                newest = max(newest, _newest_mtime(entry.path))
+            elif entry.name.endswith((".yml", ".yaml")):
+                newest = max(newest, entry.stat().st_mtime)
+    return newest
+
+
+def _load_cache(project_root):
+    """Load the cached module, or return None if it is missing or out of date"""
+    cache_path = project_root / CACHE_PATH
+    try:
+        # A cache written by older loader code is as stale as one predating
+        # the YAML, so this module's own mtime counts as a source too
+        newest = max(
+            _newest_mtime(project_root / "standard_names"), os.stat(__file__).st_mtime
+        )
+        if cache_path.stat().st_mtime < newest:
+            return None
+        # Load by path rather than import so rebuilds never see a stale module
+        spec = importlib.util.spec_from_file_location(cache_path.stem, cache_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.STANDARD_NAMES
+    except Exception:
+        # A broken or partial cache is only ever a miss, never a build failure
+        return None
+
+
+def write_cache(project_root, standard_names):
+    """
+    Write standard_names as a Python module and compile its bytecode
+
+    Returns False without writing anything when the data has no faithful
+    literal form, e.g. YAML timestamps or `.nan` values.
+    """
+    text = repr(standard_names)
+    try:
+        if ast.literal_eval(text) != standard_names:
+            return False
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return False
+
+    cache_path = Path(project_root) / CACHE_PATH
+    pyc_path = Path(importlib.util.cache_from_source(cache_path))
+
+    pyc_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, "w", encoding="utf-8") as f:
+        f.write('"""Generated from the standard_names YAML files, do not edit"""\n\n')
+        f.write(f"STANDARD_NAMES = {text}\n")
+    py_compile.compile(cache_path, cfile=pyc_path, doraise=True)
+    return True
+
+
+def _render_item(item, parts):
+    """Append the detailed markdown for a single standard name to parts"""
+    name = item.get("name", "Unknown")
+    unit = item.get("unit", "")
+    description = item.get("description", "")
+    documentation = item.get("documentation", "")
+    item_tags = item.get("tags", [])
+    status = item.get("status", "")
+
+    # Use h3 for standard names (indents under the h2 category in the sidebar)
+    parts.append(f"### {name}\n\n")
+
+    # Order: description, docs, unit, status, tags
+    parts.append(f"{description}\n\n")
+
+    if documentation:
+        parts.append(f"{_fix_markdown_formatting(documentation)}\n\n")
+
+    if unit:
+        parts.append(f"**Unit:** `{unit}`\n\n")
+
+    if status:
+        parts.append(f"**Status:** {status.title()}\n\n")
+
+    if item_tags:
+        # Format tags as simple text
+        tags_display = ", ".join(f"`{tag}`" for tag in item_tags)
+        parts.append(f"**Tags:** {tags_display}\n\n")
+
+    parts.append("---\n\n")
+
+
+def _fix_markdown_formatting(text):
+    """
+    Fix markdown formatting and ensure proper indentation for admonitions
+    """
+    if not text:
+        return ""
+
+    # Clean up the text first
+    text = text.strip()
+
+    # Handle escaped newlines from YAML
+    text = text.replace("\\n", "\n")
+
+    # Split into paragraphs, dropping blank ones. Math, lists and plain
+    # text are all preserved as-is, so no per-paragraph handling is needed
+    paragraphs = (paragraph.strip() for paragraph in text.split("\n\n"))
+    result = "\n\n".join(paragraph for paragraph in paragraphs if paragraph)
+
+    # Ensure math blocks have proper spacing
+    result = _MATH_PRE.sub("\n\n$$", result)
+    result = _MATH_POST.sub("$$\n\n", result)
+
+    return result
+
 
 def define_env(env):
     """
@@ -23,64 +235,52 @@ def define_env(env):
     except PackageNotFoundError:
         env.variables["package_version"] = "dev"
 
+    cache = _CACHE[str(env.project_dir)] = {}
+
     @env.macro
     def load_standard_names():
         """Load all YAML standard names from the standard_names directory"""
+        if "standard_names" in cache:
+            return cache["standard_names"]
+
         project_root = Path(env.project_dir)
-        standard_names_dir = project_root / "standard_names"
-        standard_names = []
-
-        # Only look in the standard_names directory
-        if standard_names_dir.exists():
-            for root, dirs, files in os.walk(standard_names_dir):
-                # Skip hidden directories
-                dirs[:] = [d for d in dirs if not d.startswith(".")]
-
-                for file in files:
-                    if file.endswith(".yml") or file.endswith(".yaml"):
-                        yaml_path = Path(root) / file
-                        try:
-                            with open(yaml_path, "r", encoding="utf-8") as f:
-                                data = yaml.safe_load(f)
-
-                            if data and isinstance(data, dict):
-                                # Add metadata
-                                data["_file_path"] = str(
-                                    yaml_path.relative_to(project_root)
-                                )
-                                data["_category"] = yaml_path.parent.name
-                                standard_names.append(data)
-                        except Exception as e:
-                            print(f"Error loading {yaml_path}: {e}")
 
+        # Fall back to parsing the YAML tree when the cache is missing or stale
+        standard_names = _load_cache(project_root)
+        if standard_names is None:
+            standard_names = collect_standard_names(project_root)
+            cache["stale"] = True
+
+        cache["standard_names"] = standard_names
         return standard_names
 
+    def _build_indices():
+        """Group standard names by category and primary tag in a single pass"""
+        if "categories" not in cache:
+            categories = defaultdict(list)
+            tags_groups = defaultdict(list)
+
+            for item in load_standard_names():
+                categories[item.get("_category", "unknown")].append(item)
+
+                if "tags" in item and item["tags"]:
+                    primary_tag = item["tags"][0]
+                    tags_groups[primary_tag].append(item)
+
+            cache["categories"] = dict(categories)
+            cache["tags"] = dict(tags_groups)
+
+        return cache["categories"], cache["tags"]
+
     @env.macro
     def get_categories():
         """Get all unique categories (directories) containing standard names"""
-        standard_names = load_standard_names()
-        categories = {}
-
-        for item in standard_names:
-            category = item.get("_category", "unknown")
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(item)
-
-        return categories
+        return _build_indices()[0]
 
     @env.macro
     def get_tags():
         """Group standard names by their primary tags"""
-        standard_names = load_standard_names()
-        tags_groups = defaultdict(list)
-
-        for item in standard_names:
-            if "tags" in item and item["tags"]:
-                primary_tag = item["tags"][0]
-                tags_groups[primary_tag].append(item)
-
-        return dict(tags_groups)
+        return _build_indices()[1]
 
     @env.macro
     def standard_names_table(items, show_category=False, show_full_description=False):
@@ -93,19 +293,21 @@ def define_env(env):
         if show_category:
             headers.append("Category")
 
-        table = "| " + " | ".join(headers) + " |\n"
-        table += "|" + "|".join([" --- " for _ in headers]) + "|\n"
+        parts = [
+            "| " + " | ".join(headers) + " |\n",
+            "|" + "|".join([" --- " for _ in headers]) + "|\n",
+        ]
 
-        # Sort by name
-        sorted_items = sorted(items, key=lambda x: x.get("name", ""))
-
-        for item in sorted_items:
+        # Items arrive in name order from load_standard_names
+        for item in items:
             name = item.get("name", "Unknown")
             unit = item.get("unit", "-")
             description = item.get("description", "No description")
 
-            # Escape special characters but don't truncate if showing full description
-            description = description.replace("|", "\\|").replace("\n", " ")
+            # Escape special characters but don't truncate if showing full description.
+            # Most descriptions need no escaping, so skip the replaces for them
+            if "|" in description or "\n" in description:
+                description = description.replace("|", "\\|").replace("\n", " ")
             if not show_full_description and len(description) > 80:
                 description = description[:77] + "..."
 
@@ -119,20 +321,22 @@ def define_env(env):
                 category_display = category.replace("-", " ").title()
                 row.append(category_display)
 
-            table += "| " + " | ".join(row) + " |\n"
+            parts.append("| " + " | ".join(row) + " |\n")
 
-        return table
+        return "".join(parts)
 
     @env.macro
     def standard_name_detail(name):
         """Get detailed information for a specific standard name"""
-        standard_names = load_standard_names()
-
-        for item in standard_names:
-            if item.get("name") == name:
-                return item
+        if "names" not in cache:
+            # Keep the first definition of a name, as the linear scan did
+            names = {}
+            for item in load_standard_names():
+                if "name" in item:
+                    names.setdefault(item["name"], item)
+            cache["names"] = names
 
-        return None
+        return cache["names"].get(name)
 
     @env.macro
     def format_tags(tags):
@@ -149,118 +353,26 @@ def define_env(env):
     @env.macro
     def standard_names_clean_list():
         """Generate a clean list with standard formatting"""
-        result = ""
+        parts = []
         categories = get_categories()
 
         # Sort categories alphabetically
         for category, items in sorted(categories.items()):
             category_name = category.replace("-", " ").title()
-            result += f"## **{category_name}** {{#{category}}}\n\n"
-            result += "---\n\n"
-
-            sorted_items = sorted(items, key=lambda x: x.get("name", ""))
-
-            for item in sorted_items:
-                name = item.get("name", "Unknown")
-                unit = item.get("unit", "")
-                description = item.get("description", "")
-                documentation = item.get("documentation", "")
-                item_tags = item.get("tags", [])
-                status = item.get("status", "")
-
-                # Format tags as simple text
-                tags_display = (
-                    ", ".join(f"`{tag}`" for tag in item_tags) if item_tags else "None"
-                )
-
-                # Use h3 for standard names (will indent under h2 category in sidebar)
-                result += f"### {name}\n\n"
-
-                # Order: description, docs, unit, status, tags
-                result += f"{description}\n\n"
-
-                if documentation:
-                    result += f"{_fix_markdown_formatting(documentation)}\n\n"
-
-                if unit:
-                    result += f"**Unit:** `{unit}`\n\n"
-
-                if status:
-                    result += f"**Status:** {status.title()}\n\n"
-
-                if item_tags:
-                    result += f"**Tags:** {tags_display}\n\n"
+            parts.append(f"## **{category_name}** {{#{category}}}\n\n")
+            parts.append("---\n\n")
 
-                result += "---\n\n"
+            for item in items:
+                _render_item(item, parts)
 
-        return result
-
-    def _fix_markdown_formatting(text):
-        """
-        Fix markdown formatting and ensure proper indentation for admonitions
-        """
-        if not text:
-            return ""
-
-        import re
-
-        # Clean up the text first
-        text = text.strip()
-
-        # Handle escaped newlines from YAML
-        text = text.replace("\\n", "\n")
-
-        # Split into paragraphs and process each one
-        paragraphs = text.split("\n\n")
-        processed_paragraphs = []
-
-        for paragraph in paragraphs:
-            paragraph = paragraph.strip()
-            if not paragraph:
-                continue
-
-            # Handle math equations - preserve them as-is but ensure proper spacing
-            if "$$" in paragraph:
-                # Block math equations
-                processed_paragraphs.append(paragraph)
-            elif paragraph.startswith("$$") and paragraph.endswith("$$"):
-                # Already a block equation
-                processed_paragraphs.append(paragraph)
-            elif "$" in paragraph and paragraph.count("$") >= 2:
-                # Contains inline math
-                processed_paragraphs.append(paragraph)
-            # Handle lists (lines starting with - or *)
-            elif any(
-                line.strip().startswith(("-", "*", "+"))
-                for line in paragraph.split("\n")
-            ):
-                # This is a list, preserve newlines within it
-                processed_paragraphs.append(paragraph)
-            # Handle numbered lists
-            elif any(
-                re.match(r"^\d+\.", line.strip()) for line in paragraph.split("\n")
-            ):
-                # This is a numbered list, preserve newlines within it
-                processed_paragraphs.append(paragraph)
-            else:
-                # Regular text paragraph
-                processed_paragraphs.append(paragraph)
-
-        # Join paragraphs back together with proper spacing
-        result = "\n\n".join(processed_paragraphs)
-
-        # Ensure math blocks have proper spacing
-        result = re.sub(r"\n\s*\$\$", "\n\n$$", result)
-        result = re.sub(r"\$\$\s*\n", "$$\n\n", result)
-
-        return result
+        return "".join(parts)
 
     @env.macro
     def category_stats():
         """Get statistics about categories and standard names"""
-        categories = get_categories()
-        tags = get_tags()
-        total_names = sum(len(items) for items in categories.values())
+        # References to the memoized groupings, no need to regroup per call
+        categories, tags = _build_indices()
+        total_names = len(load_standard_names())
 
         return {
             "total_names": total_names,
@@ -274,7 +386,7 @@ def define_env(env):
     def category_links():
         """Generate clickable category links for the home page"""
         tags = get_tags()
-        result = ""
+        parts = []
 
         # Sort categories alphabetically
         for category, items in sorted(tags.items()):
@@ -283,53 +395,38 @@ def define_env(env):
             category_anchor = category_name.lower().replace(" ", "-")
             count = len(items)
 
-            result += f"- **[{category_name}](standard-names.md#{category_anchor})** - {count} standard names\n"
+            parts.append(
+                f"- **[{category_name}](standard-names.md#{category_anchor})**"
+                f" - {count} standard names\n"
+            )
 
-        return result.strip()
+        return "".join(parts).strip()
 
     @env.macro
     def display_category(category_name):
         """Display all standard names for a specific category in detailed format"""
-        result = ""
-        tags = get_tags()
+        parts = []
 
-        if category_name not in tags:
+        # Index straight into the memoized primary-tag groups
+        items = get_tags().get(category_name)
+        if items is None:
             return f"Category '{category_name}' not found."
 
-        items = tags[category_name]
-        sorted_items = sorted(items, key=lambda x: x.get("name", ""))
-
-        for item in sorted_items:
-            name = item.get("name", "Unknown")
-            unit = item.get("unit", "")
-            description = item.get("description", "")
-            documentation = item.get("documentation", "")
-            item_tags = item.get("tags", [])
-            status = item.get("status", "")
-
-            # Format tags as simple text
-            tags_display = (
-                ", ".join(f"`{tag}`" for tag in item_tags) if item_tags else "None"
-            )
-
-            # Use h3 for standard names
-            result += f"### {name}\n\n"
-
-            # Order: description, docs, unit, status, tags
-            result += f"{description}\n\n"
-
-            if documentation:
-                result += f"{_fix_markdown_formatting(documentation)}\n\n"
+        for item in items:
+            _render_item(item, parts)
 
-            if unit:
-                result += f"**Unit:** `{unit}`\n\n"
+        return "".join(parts)
 
-            if status:
-                result += f"**Status:** {status.title()}\n\n"
 
-            if item_tags:
-                result += f"**Tags:** {tags_display}\n\n"
+def on_post_build(env):
+    """Refresh the cached module if this build had to parse the YAML tree"""
+    cache = _CACHE.get(str(env.project_dir), {})
+    standard_names = cache.get("standard_names")
 
-            result += "---\n\n"
-
-        return result
+    # Best effort: a missing, empty or read-only tree must not fail the build
+    if not cache.get("stale") or not standard_names:
+        return
+    try:
+        write_cache(env.project_dir, standard_names)
+    except (OSError, py_compile.PyCompileError) as e:
+        print(f"Warning: could not refresh {CACHE_PATH}: {e}")
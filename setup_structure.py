@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """
 Simple script to create the basic page templates for MkDocs
-This only creates the directory structure and template files
+This only creates the directory structure, template files and the
+pre-parsed standard names cache
 """
 
-import os
-import yaml
 from pathlib import Path
+from ruamel.yaml import YAML
 
-def create_basic_structure():
+from macros import CACHE_PATH, collect_standard_names, write_cache
+
+def create_basic_structure(standard_names):
     """Create the basic directory structure and template files"""
     
     # Create directories
@@ -17,32 +19,16 @@ def create_basic_structure():
     
     tags_dir.mkdir(exist_ok=True)
     
-    # Find all YAML files in the standard_names directory
+    # Collect names and primary tags from the already parsed standard names
     categories = set()
     all_names = []
-    standard_names_dir = Path("standard_names")
     
-    if standard_names_dir.exists():
-        for root, dirs, files in os.walk(standard_names_dir):
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            
-            for file in files:
-                if file.endswith('.yml') or file.endswith('.yaml'):
-                    yaml_path = Path(root) / file
-                    try:
-                        with open(yaml_path, 'r', encoding='utf-8') as f:
-                            data = yaml.safe_load(f)
-                        
-                        if data and isinstance(data, dict):
-                            name = data.get('name')
-                            tags = data.get('tags', [])
-                            if name and tags:
-                                all_names.append(name)
-                                categories.add(tags[0])  # Primary tag
-                                
-                    except Exception as e:
-                        print(f"Error processing {yaml_path}: {e}")
+    for data in standard_names:
+        name = data.get('name')
+        tags = data.get('tags', [])
+        if name and tags:
+            all_names.append(name)
+            categories.add(tags[0])  # Primary tag
     
     # Create tag category pages
     for category in sorted(categories):
@@ -56,12 +42,20 @@ This category contains standard names related to {category_display.lower()}.
 {{{{ standard_names_table(tag_items) }}}}
 """
         
-        with open(tags_dir / f"{category}.md", 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Emit each page as a single buffer in one write
+        (tags_dir / f"{category}.md").write_bytes(content.encode('utf-8'))
     
     print(f"Created {len(categories)} category pages")
     return categories, all_names
 
+def dump_cache(standard_names):
+    """Write the parsed standard names to the module cache read by the macros"""
+    if write_cache(Path.cwd(), standard_names):
+        print(f"Cached {len(standard_names)} standard names in {CACHE_PATH}")
+    else:
+        print(f"Skipped {CACHE_PATH}: standard names are not plain literals")
+    return standard_names
+
 def update_navigation(categories):
     """Update mkdocs.yml with navigation structure"""
     mkdocs_path = Path("mkdocs.yml")
@@ -82,25 +76,36 @@ def update_navigation(categories):
         category_display = category.replace('-', ' ').title()
         nav_lines.append(f"      - {category_display}: tags/{category}.md")
     
-    # Replace navigation section
+    # Locate nav with a real YAML parse, then replace only its lines so the
+    # rest of the file is kept byte for byte
+    config = YAML().load(content)
     lines = content.split('\n')
-    new_lines = []
-    in_nav = False
+    keys = list(config)
+    
+    if 'nav' in keys:
+        start = config.lc.key('nav')[0]
+        index = keys.index('nav')
+        if index + 1 < len(keys):
+            end = config.lc.key(keys[index + 1])[0]
+        else:
+            end = len(lines)
+        # Leave blank lines and comments ahead of the next key in place
+        while end > start + 1 and (
+            not lines[end - 1].strip() or lines[end - 1].lstrip().startswith('#')
+        ):
+            end -= 1
+    else:
+        start = end = len(lines)
     
-    for line in lines:
-        if line.startswith('nav:'):
-            in_nav = True
-            new_lines.extend(nav_lines)
-        elif in_nav and line and not line.startswith(' ') and not line.startswith('\t'):
-            in_nav = False
-            new_lines.append(line)
-        elif not in_nav:
-            new_lines.append(line)
+    lines[start:end] = nav_lines
     
     with open(mkdocs_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(new_lines))
+        f.write('\n'.join(lines))
 
 if __name__ == "__main__":
-    categories, names = create_basic_structure()
+    # Parse the YAML tree once and share it between the pages and the cache
+    standard_names = collect_standard_names(Path.cwd())
+    categories, names = create_basic_structure(standard_names)
     update_navigation(categories)
+    dump_cache(standard_names)
     print("Basic structure created successfully!")
\ No newline at end of file